@@ -1,16 +1,62 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import os
+import re
+import sys
+import matplotlib
+
+# Render straight to file with Agg when run as a script without a display
+if (__name__ == "__main__" and sys.platform.startswith('linux')
+        and not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from datetime import datetime, timedelta
+import matplotlib.dates as mdates
+from matplotlib.collections import PolyCollection
+from datetime import datetime
 import numpy as np
 
-# Set style for better-looking plots
-sns.set_style("whitegrid")
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 plt.rcParams['figure.figsize'] = (15, 10)
 
+# seaborn is slow to import, so it is loaded on first use
+_sns = None
+
+def _get_sns():
+    """Import seaborn on first use and apply the dashboard style"""
+    global _sns
+    if _sns is None:
+        import seaborn as sns
+        # Set style for better-looking plots
+        sns.set_style("whitegrid")
+        _sns = sns
+    return _sns
+
+# Serializes console output from concurrent fetch threads
+_print_lock = threading.Lock()
+
+# Maximum pooled connections per HTTP session
+SESSION_POOL_SIZE = 4
+
+# Shared random generator and condition distribution for demo data
+rng = np.random.default_rng()
+DEMO_CONDITIONS = np.array(['Clear', 'Clouds', 'Rain'])
+DEMO_CONDITION_PROBS = np.array([0.4, 0.5, 0.1])
+
 class WeatherDashboard:
-    def __init__(self, api_key, city="London", use_demo=False):
+    def __init__(self, api_key, city="London", use_demo=False, session=None):
         """
         Initialize the Weather Dashboard
         
@@ -18,254 +64,462 @@ class WeatherDashboard:
         api_key (str): Your OpenWeatherMap API key
         city (str): City name for weather data
         use_demo (bool): Use demo data instead of API
+        session (requests.Session): Existing session to share, optional
         """
         self.api_key = api_key
         self.city = city
         self.base_url = "http://api.openweathermap.org/data/2.5"
         self.use_demo = use_demo
+        self.session = session if session is not None else self._create_session()
+        self._demo_cache = None
+        self._demo_lock = threading.Lock()
+        self._fig = None
+        self._axes = None
+        self._artists = None
+    
+    @staticmethod
+    def _create_session():
+        """Create the HTTP session used for API calls"""
+        # Shared session keeps connections alive across API calls.
+        # With requests-cache installed, responses are also cached on disk
+        # for the API's refresh window (10 min current, 3 h forecast).
+        if requests_cache is not None:
+            session = requests_cache.CachedSession(
+                'weather_cache',
+                backend='sqlite',
+                urls_expire_after={
+                    '*/data/2.5/weather': 600,
+                    '*/data/2.5/forecast': 10800,
+                },
+                stale_if_error=True
+            )
+        else:
+            session = requests.Session()
+        # Retry transient failures (rate limiting, server errors) with backoff
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=['GET'])
+        adapter = HTTPAdapter(pool_connections=SESSION_POOL_SIZE,
+                              pool_maxsize=SESSION_POOL_SIZE, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    @classmethod
+    def batch(cls, cities, api_key, use_demo=False, render=False):
+        """
+        Fetch current weather and forecast for several cities concurrently
         
-    def generate_demo_data(self):
-        """Generate realistic demo weather data"""
-        print("Using DEMO DATA - API key not required")
+        Parameters:
+        cities (list): City names to fetch
+        api_key (str): Your OpenWeatherMap API key
+        use_demo (bool): Use demo data instead of API
+        render (bool): Also save a dashboard per city, drawn into one shared
+                       figure (weather_dashboard_<city>[_demo].png)
         
-        # Current weather demo
-        current = {
-            'main': {
-                'temp': 18.5,
-                'feels_like': 17.2,
-                'humidity': 65,
-                'pressure': 1013
-            },
-            'wind': {'speed': 4.5},
-            'weather': [{'description': 'partly cloudy', 'main': 'Clouds'}]
-        }
+        Returns:
+        list: (current, forecast, is_demo) tuples, in the same order as cities.
+              is_demo is True when the city fell back to generated demo data.
+        """
+        with cls._create_session() as session:
+            dashboards = [cls(api_key, city, use_demo=use_demo, session=session)
+                          for city in cities]
+            
+            # One worker per pooled connection, so every request reuses a connection
+            with ThreadPoolExecutor(max_workers=SESSION_POOL_SIZE) as executor:
+                futures = [(executor.submit(d.fetch_current_weather),
+                            executor.submit(d.fetch_forecast))
+                           for d in dashboards]
+                results = [(current.result(), forecast.result())
+                           for current, forecast in futures]
+        
+        batched = []
+        for dashboard, (current, forecast) in zip(dashboards, results):
+            # Keep a city's current and forecast data from the same source
+            if dashboard.use_demo:
+                current, forecast = dashboard.generate_demo_data()
+            batched.append((current, forecast, dashboard.use_demo))
+        
+        if render:
+            # Every city is drawn into the first city's figure skeleton;
+            # later cities only swap in their data
+            figure = None
+            for dashboard, (current, forecast, is_demo) in zip(dashboards, batched):
+                if not current or not forecast:
+                    continue
+                if figure is not None:
+                    dashboard._fig, dashboard._axes, dashboard._artists = figure
+                name = re.sub(r'\W+', '_', dashboard.city).strip('_').lower()
+                suffix = '_demo' if is_demo else ''
+                dashboard._render(current, forecast, f'weather_dashboard_{name}{suffix}.png')
+                figure = dashboard._fig, dashboard._axes, dashboard._artists
+            if figure is not None:
+                plt.close(figure[0])
+        
+        return batched
+    
+    def generate_demo_data(self):
+        """Generate realistic demo weather data (cached after the first call)"""
+        with self._demo_lock:
+            if self._demo_cache is None:
+                self._demo_cache = self._build_demo_data()
+            return self._demo_cache
+    
+    def _build_demo_data(self):
+        """Build one consistent set of demo current + forecast data"""
+        with _print_lock:
+            print("Using DEMO DATA - API key not required")
         
         # Forecast demo data (40 data points = 5 days)
-        base_time = datetime.now()
-        forecast_list = []
+        i = np.arange(40)
+        base_ts = datetime.now().timestamp()
         
-        for i in range(40):
-            time_point = base_time + timedelta(hours=i*3)
-            # Generate realistic temperature variation
-            temp = 18 + 5 * np.sin(i * np.pi / 8) + np.random.uniform(-2, 2)
-            
-            forecast_list.append({
-                'dt': int(time_point.timestamp()),
+        # Generate realistic variation for every time step at once
+        times = (base_ts + i * 3 * 3600).astype(int)
+        temps = np.round(18 + 5 * np.sin(i * np.pi / 8) + rng.uniform(-2, 2, 40), 1)
+        feels = np.round(temps - 1.5, 1)
+        hums = (60 + 20 * np.sin(i * np.pi / 12) + rng.uniform(-5, 5, 40)).astype(int)
+        press = (1010 + 10 * np.sin(i * np.pi / 20)).astype(int)
+        winds = np.round(3 + 3 * rng.random(40), 1)
+        weather = rng.choice(DEMO_CONDITIONS, size=40, p=DEMO_CONDITION_PROBS)
+        
+        forecast_list = [
+            {
+                'dt': int(dt),
                 'main': {
-                    'temp': round(temp, 1),
-                    'feels_like': round(temp - 1.5, 1),
-                    'humidity': int(60 + 20 * np.sin(i * np.pi / 12) + np.random.uniform(-5, 5)),
-                    'pressure': int(1010 + 10 * np.sin(i * np.pi / 20))
+                    'temp': float(t),
+                    'feels_like': float(f),
+                    'humidity': int(h),
+                    'pressure': int(p)
                 },
-                'wind': {'speed': round(3 + 3 * np.random.random(), 1)},
-                'weather': [{'main': np.random.choice(['Clear', 'Clouds', 'Rain'], p=[0.4, 0.5, 0.1]),
-                           'description': 'demo weather'}]
-            })
+                'wind': {'speed': float(w)},
+                'weather': [{'main': str(c), 'description': 'demo weather'}]
+            }
+            for dt, t, f, h, p, w, c in zip(times, temps, feels, hums, press, winds, weather)
+        ]
         
         forecast = {'list': forecast_list}
         
+        # Current weather demo mirrors the first forecast entry
+        first = forecast_list[0]
+        condition = first['weather'][0]['main']
+        current = {
+            'main': dict(first['main']),
+            'wind': dict(first['wind']),
+            'weather': [{'description': condition.lower(), 'main': condition}]
+        }
+        
         return current, forecast
     
-    def fetch_current_weather(self):
-        """Fetch current weather data"""
-        if self.use_demo:
-            current, _ = self.generate_demo_data()
-            return current
+    def _get(self, endpoint):
+        """Fetch an API endpoint, falling back to demo data on failure"""
+        if not self.use_demo:
+            url = f"{self.base_url}/{endpoint}"
+            params = {
+                'q': self.city,
+                'appid': self.api_key,
+                'units': 'metric'
+            }
             
-        url = f"{self.base_url}/weather"
-        params = {
-            'q': self.city,
-            'appid': self.api_key,
-            'units': 'metric'
-        }
+            try:
+                response = self.session.get(url, params=params, timeout=5)
+                response.raise_for_status()
+                if orjson is not None:
+                    return orjson.loads(response.content)
+                return response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                with self._demo_lock:
+                    switched = not self.use_demo
+                    self.use_demo = True
+                with _print_lock:
+                    print(f"Error fetching {endpoint}: {e}")
+                    if switched:
+                        print("\n⚠️  API KEY ISSUE DETECTED!")
+                        print("Your API key may not be activated yet (takes up to 2 hours)")
+                        print("Switching to DEMO MODE...\n")
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching current weather: {e}")
-            print("\n⚠️  API KEY ISSUE DETECTED!")
-            print("Your API key may not be activated yet (takes up to 2 hours)")
-            print("Switching to DEMO MODE...\n")
-            self.use_demo = True
-            return self.fetch_current_weather()
+        return self.generate_demo_data()[0 if endpoint == 'weather' else 1]
+    
+    def fetch_current_weather(self):
+        """Fetch current weather data"""
+        return self._get('weather')
     
     def fetch_forecast(self):
         """Fetch 5-day weather forecast"""
-        if self.use_demo:
-            _, forecast = self.generate_demo_data()
-            return forecast
-            
-        url = f"{self.base_url}/forecast"
-        params = {
-            'q': self.city,
-            'appid': self.api_key,
-            'units': 'metric'
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching forecast: {e}")
-            self.use_demo = True
-            return self.fetch_forecast()
+        return self._get('forecast')
     
     def process_forecast_data(self, forecast_data):
-        """Process forecast data into a pandas DataFrame"""
+        """Process forecast data into a dict of NumPy column arrays"""
         if not forecast_data:
             return None
         
-        data_list = []
-        for item in forecast_data['list']:
-            data_list.append({
-                'datetime': datetime.fromtimestamp(item['dt']),
-                'temperature': item['main']['temp'],
-                'feels_like': item['main']['feels_like'],
-                'humidity': item['main']['humidity'],
-                'pressure': item['main']['pressure'],
-                'wind_speed': item['wind']['speed'],
-                'weather': item['weather'][0]['main'],
-                'description': item['weather'][0]['description']
-            })
-        
-        return pd.DataFrame(data_list)
+        items = forecast_data['list']
+        # Shift UTC timestamps to local wall-clock time, as datetime.fromtimestamp did
+        utc_offset = np.timedelta64(
+            int(datetime.now().astimezone().utcoffset().total_seconds()), 's')
+        return {
+            'datetime': np.array([item['dt'] for item in items], dtype='datetime64[s]') + utc_offset,
+            'temperature': np.array([item['main']['temp'] for item in items], dtype=np.float32),
+            'feels_like': np.array([item['main']['feels_like'] for item in items], dtype=np.float32),
+            'humidity': np.array([item['main']['humidity'] for item in items], dtype=np.int16),
+            'pressure': np.array([item['main']['pressure'] for item in items], dtype=np.int16),
+            'wind_speed': np.array([item['wind']['speed'] for item in items], dtype=np.float32),
+            'weather': np.array([item['weather'][0]['main'] for item in items]),
+            'description': np.array([item['weather'][0]['description'] for item in items])
+        }
     
-    def create_dashboard(self):
-        """Create comprehensive weather visualization dashboard"""
-        # Fetch data
-        current = self.fetch_current_weather()
-        forecast = self.fetch_forecast()
-        
-        if not current or not forecast:
-            print("Failed to fetch weather data. Please check your API key and internet connection.")
-            return
-        
-        # Process forecast data
-        df = self.process_forecast_data(forecast)
+    @staticmethod
+    def _format_date_axis(ax):
+        """Apply concise date ticks with rotated labels to an axis"""
+        locator = mdates.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        ax.tick_params(axis='x', labelrotation=45)
+        # Ticks created later copy the first tick's label alignment
+        plt.setp(ax.get_xticklabels(), ha='right')
+    
+    def _build_figure(self):
+        """Build the dashboard figure skeleton once and cache it"""
+        if self._fig is not None and plt.fignum_exists(self._fig.number):
+            return self._fig, self._axes, self._artists
         
-        # Create figure with subplots
+        _get_sns()
         fig = plt.figure(figsize=(16, 12))
-        title_suffix = " (DEMO DATA)" if self.use_demo else ""
-        fig.suptitle(f'Weather Dashboard - {self.city}{title_suffix}', 
-                    fontsize=20, fontweight='bold', y=0.995)
+        artists = {}
+        artists['title'] = fig.suptitle('', fontsize=20, fontweight='bold', y=0.995)
         
         # 1. Current Weather Info (Text Box)
-        ax1 = plt.subplot(3, 3, 1)
+        ax1 = fig.add_subplot(3, 3, 1)
         ax1.axis('off')
-        current_info = f"""
-        CURRENT CONDITIONS
-        
-        Temperature: {current['main']['temp']:.1f}°C
-        Feels Like: {current['main']['feels_like']:.1f}°C
-        Humidity: {current['main']['humidity']}%
-        Pressure: {current['main']['pressure']} hPa
-        Wind Speed: {current['wind']['speed']} m/s
-        Conditions: {current['weather'][0]['description'].title()}
-        """
-        ax1.text(0.1, 0.5, current_info, fontsize=12, verticalalignment='center',
-                bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
+        artists['current_text'] = ax1.text(
+            0.1, 0.5, '', fontsize=12, verticalalignment='center',
+            bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.5))
         
         # 2. Temperature Forecast Line Plot
-        ax2 = plt.subplot(3, 3, 2)
-        ax2.plot(df['datetime'], df['temperature'], marker='o', linewidth=2, 
-                color='#FF6B6B', label='Temperature')
-        ax2.plot(df['datetime'], df['feels_like'], marker='s', linewidth=2, 
-                linestyle='--', color='#4ECDC4', label='Feels Like')
+        ax2 = fig.add_subplot(3, 3, 2)
+        # Preallocated lines; refreshes only swap their data via set_data
+        artists['temp_line'], = ax2.plot([], [], marker='o', linewidth=2, 
+                                         color='#FF6B6B', label='Temperature')
+        artists['feels_line'], = ax2.plot([], [], marker='s', linewidth=2, 
+                                          linestyle='--', color='#4ECDC4', label='Feels Like')
         ax2.set_title('Temperature Forecast (5 Days)', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Date/Time')
         ax2.set_ylabel('Temperature (°C)')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax2)
         
         # 3. Temperature Distribution
-        ax3 = plt.subplot(3, 3, 3)
-        sns.histplot(data=df, x='temperature', kde=True, color='#FF6B6B', ax=ax3)
+        ax3 = fig.add_subplot(3, 3, 3)
+        artists['kde_line'], = ax3.plot([], [], color='#FF6B6B', linewidth=2)
         ax3.set_title('Temperature Distribution', fontsize=14, fontweight='bold')
         ax3.set_xlabel('Temperature (°C)')
         ax3.set_ylabel('Frequency')
         
         # 4. Humidity Over Time
-        ax4 = plt.subplot(3, 3, 4)
-        ax4.fill_between(df['datetime'], df['humidity'], alpha=0.3, color='#95E1D3')
-        ax4.plot(df['datetime'], df['humidity'], marker='o', color='#38ada9', linewidth=2)
+        ax4 = fig.add_subplot(3, 3, 4)
+        artists['hum_fill'] = ax4.add_collection(
+            PolyCollection([], alpha=0.3, facecolor='#95E1D3', rasterized=True))
+        artists['hum_line'], = ax4.plot([], [], marker='o', color='#38ada9', linewidth=2)
         ax4.set_title('Humidity Forecast', fontsize=14, fontweight='bold')
         ax4.set_xlabel('Date/Time')
         ax4.set_ylabel('Humidity (%)')
         ax4.grid(True, alpha=0.3)
-        plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax4)
         
         # 5. Wind Speed
-        ax5 = plt.subplot(3, 3, 5)
-        ax5.bar(df['datetime'], df['wind_speed'], color='#A8E6CF', edgecolor='#56ab91')
+        ax5 = fig.add_subplot(3, 3, 5)
         ax5.set_title('Wind Speed Forecast', fontsize=14, fontweight='bold')
         ax5.set_xlabel('Date/Time')
         ax5.set_ylabel('Wind Speed (m/s)')
         ax5.grid(True, alpha=0.3, axis='y')
-        plt.setp(ax5.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax5)
         
         # 6. Pressure Trend
-        ax6 = plt.subplot(3, 3, 6)
-        ax6.plot(df['datetime'], df['pressure'], marker='D', color='#FFD93D', 
-                linewidth=2, markersize=4)
+        ax6 = fig.add_subplot(3, 3, 6)
+        artists['pres_line'], = ax6.plot([], [], marker='D', color='#FFD93D', 
+                                         linewidth=2, markersize=4)
         ax6.set_title('Atmospheric Pressure', fontsize=14, fontweight='bold')
         ax6.set_xlabel('Date/Time')
         ax6.set_ylabel('Pressure (hPa)')
         ax6.grid(True, alpha=0.3)
-        plt.setp(ax6.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        self._format_date_axis(ax6)
         
         # 7. Weather Conditions Pie Chart
-        ax7 = plt.subplot(3, 3, 7)
-        weather_counts = df['weather'].value_counts()
-        colors = sns.color_palette('pastel')[0:len(weather_counts)]
-        ax7.pie(weather_counts.values, labels=weather_counts.index, autopct='%1.1f%%',
-               colors=colors, startangle=90)
+        ax7 = fig.add_subplot(3, 3, 7)
         ax7.set_title('Weather Conditions Distribution', fontsize=14, fontweight='bold')
         
         # 8. Temperature vs Humidity Scatter
-        ax8 = plt.subplot(3, 3, 8)
-        scatter = ax8.scatter(df['temperature'], df['humidity'], 
-                             c=df['wind_speed'], cmap='viridis', 
-                             s=100, alpha=0.6, edgecolors='black')
+        ax8 = fig.add_subplot(3, 3, 8)
+        artists['scatter'] = ax8.scatter([], [], c=[], cmap='viridis',
+                                         norm=plt.Normalize(0, 1),
+                                         s=100, alpha=0.6, edgecolors='black', rasterized=True)
         ax8.set_title('Temperature vs Humidity', fontsize=14, fontweight='bold')
         ax8.set_xlabel('Temperature (°C)')
         ax8.set_ylabel('Humidity (%)')
-        cbar = plt.colorbar(scatter, ax=ax8)
+        cbar = fig.colorbar(artists['scatter'], ax=ax8)
         cbar.set_label('Wind Speed (m/s)')
         ax8.grid(True, alpha=0.3)
         
         # 9. Daily Temperature Range
-        ax9 = plt.subplot(3, 3, 9)
-        df['date'] = df['datetime'].dt.date
-        daily_stats = df.groupby('date').agg({
-            'temperature': ['min', 'max', 'mean']
-        }).reset_index()
-        daily_stats.columns = ['date', 'min_temp', 'max_temp', 'mean_temp']
-        
-        x_pos = range(len(daily_stats))
-        ax9.bar(x_pos, daily_stats['max_temp'] - daily_stats['min_temp'], 
-               bottom=daily_stats['min_temp'], color='#FFEAA7', 
-               edgecolor='#FDCB6E', alpha=0.7)
-        ax9.plot(x_pos, daily_stats['mean_temp'], marker='o', color='#E17055', 
-                linewidth=2, markersize=8, label='Mean')
-        ax9.set_xticks(x_pos)
-        ax9.set_xticklabels(daily_stats['date'], rotation=45, ha='right')
+        ax9 = fig.add_subplot(3, 3, 9)
+        artists['mean_line'], = ax9.plot([], [], marker='o', color='#E17055', 
+                                         linewidth=2, markersize=8, label='Mean')
         ax9.set_title('Daily Temperature Range', fontsize=14, fontweight='bold')
         ax9.set_xlabel('Date')
         ax9.set_ylabel('Temperature (°C)')
-        ax9.legend()
+        ax9.legend(loc='upper left')
         ax9.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
-        filename = 'weather_dashboard_demo.png' if self.use_demo else 'weather_dashboard.png'
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
+        # Fixed padding avoids the extra layout pass of tight_layout/bbox_inches
+        fig.subplots_adjust(left=0.06, right=0.97, bottom=0.10, top=0.93,
+                            wspace=0.35, hspace=0.7)
+        
+        # Artists whose count depends on the data; replaced on every update
+        artists['replaceable'] = []
+        
+        self._fig = fig
+        self._axes = dict(zip(
+            ('current', 'temp', 'hist', 'humidity', 'wind', 'pressure',
+             'weather', 'scatter', 'daily'),
+            (ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9)))
+        self._artists = artists
+        return fig, self._axes, artists
+    
+    def _update_artists(self, data, current):
+        """Redraw the data-dependent artists of the cached figure"""
+        axes, artists = self._axes, self._artists
+        
+        t = mdates.date2num(data['datetime'])
+        temp, feels, hum, pres, wind = (
+            data[col]
+            for col in ('temperature', 'feels_like', 'humidity', 'pressure', 'wind_speed')
+        )
+        
+        for artist in artists['replaceable']:
+            artist.remove()
+        replaceable = artists['replaceable'] = []
+        
+        title_suffix = " (DEMO DATA)" if self.use_demo else ""
+        artists['title'].set_text(f'Weather Dashboard - {self.city}{title_suffix}')
+        
+        # 1. Current Weather Info
+        artists['current_text'].set_text(f"""
+        CURRENT CONDITIONS
+        
+        Temperature: {current['main']['temp']:.1f}°C
+        Feels Like: {current['main']['feels_like']:.1f}°C
+        Humidity: {current['main']['humidity']}%
+        Pressure: {current['main']['pressure']} hPa
+        Wind Speed: {current['wind']['speed']} m/s
+        Conditions: {current['weather'][0]['description'].title()}
+        """)
+        
+        # 2. Temperature Forecast
+        artists['temp_line'].set_data(t, temp)
+        artists['feels_line'].set_data(t, feels)
+        
+        # 3. Temperature Distribution
+        counts, edges = np.histogram(temp, bins='auto')
+        replaceable.append(axes['hist'].bar(
+            edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='#FF6B6B', edgecolor='white', alpha=0.6))
+        # Gaussian KDE (Scott's rule) scaled to the histogram counts
+        bandwidth = temp.std(ddof=1) * len(temp) ** (-1 / 5)
+        if bandwidth > 0:
+            xs = np.linspace(temp.min(), temp.max(), 100)
+            kde = np.exp(-0.5 * ((xs[:, None] - temp) / bandwidth) ** 2).sum(axis=1)
+            kde /= bandwidth * np.sqrt(2 * np.pi)
+            artists['kde_line'].set_data(xs, kde * (edges[1] - edges[0]))
+        else:
+            artists['kde_line'].set_data([], [])
+        
+        # 4. Humidity Over Time
+        hum_verts = np.column_stack([np.r_[t[0], t, t[-1]], np.r_[0, hum, 0]])
+        artists['hum_fill'].set_verts([hum_verts])
+        artists['hum_line'].set_data(t, hum)
+        
+        # 5. Wind Speed
+        replaceable.append(axes['wind'].bar(t, wind, color='#A8E6CF',
+                                            edgecolor='#56ab91', rasterized=True))
+        
+        # 6. Pressure Trend
+        artists['pres_line'].set_data(t, pres)
+        
+        # 7. Weather Conditions Pie Chart
+        conditions, condition_counts = np.unique(data['weather'], return_counts=True)
+        colors = _get_sns().color_palette('pastel')[0:len(conditions)]
+        wedges, labels, pcts = axes['weather'].pie(
+            condition_counts, labels=conditions, autopct='%1.1f%%',
+            colors=colors, startangle=90)
+        replaceable.extend(wedges + labels + pcts)
+        
+        # 8. Temperature vs Humidity Scatter
+        scatter_points = np.column_stack([temp, hum])
+        artists['scatter'].set_offsets(scatter_points)
+        artists['scatter'].set_array(wind)
+        artists['scatter'].set_clim(wind.min(), wind.max())
+        
+        # 9. Daily Temperature Range
+        days, day_idx = np.unique(data['datetime'].astype('datetime64[D]'), return_inverse=True)
+        day_min = np.full(len(days), np.inf)
+        np.minimum.at(day_min, day_idx, temp)
+        day_max = np.full(len(days), -np.inf)
+        np.maximum.at(day_max, day_idx, temp)
+        day_mean = np.bincount(day_idx, weights=temp) / np.bincount(day_idx)
+        
+        x_pos = range(len(days))
+        replaceable.append(axes['daily'].bar(
+            x_pos, day_max - day_min, bottom=day_min,
+            color='#FFEAA7', edgecolor='#FDCB6E', alpha=0.7))
+        artists['mean_line'].set_data(x_pos, day_mean)
+        axes['daily'].set_xticks(x_pos)
+        axes['daily'].set_xticklabels(np.datetime_as_string(days), rotation=45, ha='right')
+        
+        # Rescale to the new data; relim() skips collections, so add them explicitly
+        for name in ('temp', 'hist', 'humidity', 'wind', 'pressure', 'scatter', 'daily'):
+            axes[name].relim()
+        axes['humidity'].update_datalim(hum_verts)
+        axes['scatter'].update_datalim(scatter_points)
+        for name in ('temp', 'hist', 'humidity', 'wind', 'pressure', 'scatter', 'daily'):
+            axes[name].autoscale_view()
+    
+    def _render(self, current, forecast, filename):
+        """Draw fetched data into the cached figure and save it"""
+        # Process forecast data
+        data = self.process_forecast_data(forecast)
+        
+        # Reuse the cached figure skeleton and only redraw the data
+        fig, _, _ = self._build_figure()
+        self._update_artists(data, current)
+        
+        fig.savefig(filename, dpi=300)
         print(f"\n✅ Dashboard saved as '{filename}'")
-        plt.show()
+        return data
+    
+    def create_dashboard(self):
+        """Create comprehensive weather visualization dashboard"""
+        # Fetch current weather and forecast concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(self.fetch_current_weather)
+            forecast_future = executor.submit(self.fetch_forecast)
+            current, forecast = current_future.result(), forecast_future.result()
+        
+        # A failure on either endpoint switches to demo mode; use demo data for
+        # both so current conditions and forecast come from the same source
+        if self.use_demo:
+            current, forecast = self.generate_demo_data()
         
-        return df
+        if not current or not forecast:
+            print("Failed to fetch weather data. Please check your API key and internet connection.")
+            return
+        
+        filename = 'weather_dashboard_demo.png' if self.use_demo else 'weather_dashboard.png'
+        data = self._render(current, forecast, filename)
+        if matplotlib.get_backend().lower() != 'agg':
+            plt.show()
+        
+        return data
 
 # Example usage
 if __name__ == "__main__":
@@ -286,12 +540,17 @@ if __name__ == "__main__":
     
     # Create dashboard
     dashboard = WeatherDashboard(API_KEY, CITY, use_demo=USE_DEMO)
-    weather_df = dashboard.create_dashboard()
+    weather_data = dashboard.create_dashboard()
     
     # Print summary statistics
-    if weather_df is not None:
+    if weather_data is not None:
+        import pandas as pd
+        
         print("\n" + "="*60)
         print("WEATHER STATISTICS SUMMARY")
         print("="*60)
-        print(weather_df[['temperature', 'humidity', 'wind_speed']].describe())
+        # Upcast and round back to the API's 2-decimal precision so float32
+        # storage artifacts (24.299999) don't leak into the printed statistics
+        summary = pd.DataFrame({k: weather_data[k] for k in ('temperature', 'humidity', 'wind_speed')})
+        print(summary.astype('float64').round(2).describe())
         print("\n✅ Dashboard generation complete!")
\ No newline at end of file